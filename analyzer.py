@@ -1,17 +1,92 @@
 """
 Data analysis module for weather data insights.
 """
+import functools
+import re
+import numpy as np
 import pandas as pd
 from typing import Dict, List, Tuple, Optional
-from collections import Counter
 from config import TEMP_RANGES
 
+# One group per weather category, listed in order of precedence
+_WEATHER_PATTERN = re.compile(
+    r'(clear|sunny)|(rain|drizzle|shower)|(cloud|overcast)|(snow|blizzard)',
+    re.IGNORECASE
+)
+_WEATHER_CATEGORIES = ['clear', 'rain', 'clouds', 'snow', 'other']
+
+
+def _weather_category_index(description: str) -> int:
+    """Return the index in _WEATHER_CATEGORIES that a description belongs to."""
+    # A description can match several groups; the earliest category wins
+    return min(
+        (match.lastindex - 1 for match in _WEATHER_PATTERN.finditer(description)),
+        default=len(_WEATHER_CATEGORIES) - 1
+    )
+
+
+def _memoized(method):
+    """Cache a WeatherAnalyzer method's result in the instance's _cache dict."""
+    @functools.wraps(method)
+    def wrapper(self):
+        if method.__name__ not in self._cache:
+            self._cache[method.__name__] = method(self)
+        # Shallow copy only: the nested stats dicts and city lists are shared
+        # with the cache and must be treated as read-only
+        return dict(self._cache[method.__name__])
+    return wrapper
+
 
 class WeatherAnalyzer:
     """Class to analyze weather data and generate insights."""
     
     def __init__(self, data: pd.DataFrame):
         self.data = data
+        self._cache = {}
+        
+        # Every analysis returns early on empty data, which may lack columns
+        if data.empty:
+            return
+        
+        # Extract the columns once so each analysis works on plain arrays
+        # instead of re-indexing the DataFrame
+        self._cities = data['city'].to_numpy()
+        self._columns = {
+            column: data[column].to_numpy()
+            for column in ('temperature', 'humidity', 'wind_speed')
+        }
+        
+        # Descriptions repeat across cities, so string matching runs on the few
+        # distinct categories and is mapped back to rows through their codes
+        description = data['description'].astype('category')
+        self._description_codes = description.cat.codes.to_numpy()
+        self._description_categories = description.cat.categories
+    
+    def _column_stats(self, column: str) -> Dict:
+        """
+        Calculate summary statistics for a numeric column in a single pass.
+        
+        Args:
+            column (str): Name of the numeric column
+            
+        Returns:
+            Dict: Max, min, mean and median values with the max/min cities
+        """
+        values = self._columns[column]
+        cities = self._cities
+        
+        # NaN-aware variants skip missing readings, matching pandas' skipna
+        max_idx = np.nanargmax(values)
+        min_idx = np.nanargmin(values)
+        
+        return {
+            'max': values[max_idx],
+            'min': values[min_idx],
+            'mean': round(np.nanmean(values), 1),
+            'median': round(np.nanmedian(values), 1),
+            'max_city': cities[max_idx],
+            'min_city': cities[min_idx]
+        }
     
     def get_temperature_stats(self) -> Dict:
         """
@@ -23,21 +98,16 @@ class WeatherAnalyzer:
         if self.data.empty:
             return {}
         
-        temp_stats = {
-            'highest_temp': self.data['temperature'].max(),
-            'lowest_temp': self.data['temperature'].min(),
-            'average_temp': round(self.data['temperature'].mean(), 1),
-            'median_temp': round(self.data['temperature'].median(), 1)
-        }
-        
-        # Find cities with highest and lowest temperatures
-        highest_city = self.data.loc[self.data['temperature'].idxmax(), 'city']
-        lowest_city = self.data.loc[self.data['temperature'].idxmin(), 'city']
-        
-        temp_stats['highest_temp_city'] = highest_city
-        temp_stats['lowest_temp_city'] = lowest_city
+        stats = self._column_stats('temperature')
         
-        return temp_stats
+        return {
+            'highest_temp': stats['max'],
+            'lowest_temp': stats['min'],
+            'average_temp': stats['mean'],
+            'median_temp': stats['median'],
+            'highest_temp_city': stats['max_city'],
+            'lowest_temp_city': stats['min_city']
+        }
     
     def get_humidity_stats(self) -> Dict:
         """
@@ -49,12 +119,14 @@ class WeatherAnalyzer:
         if self.data.empty:
             return {}
         
+        stats = self._column_stats('humidity')
+        
         return {
-            'highest_humidity': self.data['humidity'].max(),
-            'lowest_humidity': self.data['humidity'].min(),
-            'average_humidity': round(self.data['humidity'].mean(), 1),
-            'highest_humidity_city': self.data.loc[self.data['humidity'].idxmax(), 'city'],
-            'lowest_humidity_city': self.data.loc[self.data['humidity'].idxmin(), 'city']
+            'highest_humidity': stats['max'],
+            'lowest_humidity': stats['min'],
+            'average_humidity': stats['mean'],
+            'highest_humidity_city': stats['max_city'],
+            'lowest_humidity_city': stats['min_city']
         }
     
     def get_wind_stats(self) -> Dict:
@@ -67,12 +139,14 @@ class WeatherAnalyzer:
         if self.data.empty:
             return {}
         
+        stats = self._column_stats('wind_speed')
+        
         return {
-            'highest_wind': self.data['wind_speed'].max(),
-            'lowest_wind': self.data['wind_speed'].min(),
-            'average_wind': round(self.data['wind_speed'].mean(), 1),
-            'highest_wind_city': self.data.loc[self.data['wind_speed'].idxmax(), 'city'],
-            'lowest_wind_city': self.data.loc[self.data['wind_speed'].idxmin(), 'city']
+            'highest_wind': stats['max'],
+            'lowest_wind': stats['min'],
+            'average_wind': stats['mean'],
+            'highest_wind_city': stats['max_city'],
+            'lowest_wind_city': stats['min_city']
         }
     
     def categorize_weather(self) -> Dict[str, List[str]]:
@@ -85,30 +159,18 @@ class WeatherAnalyzer:
         if self.data.empty:
             return {}
         
-        weather_categories = {
-            'clear': [],
-            'rain': [],
-            'clouds': [],
-            'snow': [],
-            'other': []
-        }
+        category_indexes = [
+            _weather_category_index(description)
+            for description in self._description_categories
+        ]
+        # Missing descriptions have code -1, which picks the trailing 'other' entry
+        category_indexes.append(len(_WEATHER_CATEGORIES) - 1)
+        row_indexes = np.array(category_indexes)[self._description_codes]
         
-        for _, row in self.data.iterrows():
-            description = row['description'].lower()
-            city = row['city']
-            
-            if any(word in description for word in ['clear', 'sunny']):
-                weather_categories['clear'].append(city)
-            elif any(word in description for word in ['rain', 'drizzle', 'shower']):
-                weather_categories['rain'].append(city)
-            elif any(word in description for word in ['cloud', 'overcast']):
-                weather_categories['clouds'].append(city)
-            elif any(word in description for word in ['snow', 'blizzard']):
-                weather_categories['snow'].append(city)
-            else:
-                weather_categories['other'].append(city)
-        
-        return weather_categories
+        return {
+            category: self._cities[row_indexes == i].tolist()
+            for i, category in enumerate(_WEATHER_CATEGORIES)
+        }
     
     def get_weather_distribution(self) -> Dict[str, int]:
         """
@@ -120,8 +182,9 @@ class WeatherAnalyzer:
         if self.data.empty:
             return {}
         
-        weather_counts = Counter(self.data['description'])
-        return dict(weather_counts.most_common())
+        weather_counts = self.data['description'].value_counts()
+        # Categorical columns also report unused categories with a zero count
+        return weather_counts[weather_counts > 0].to_dict()
     
     def get_temperature_ranges(self) -> Dict[str, List[str]]:
         """
@@ -133,41 +196,42 @@ class WeatherAnalyzer:
         if self.data.empty:
             return {}
         
-        temp_ranges = {
-            'very_hot': [],    # > configured threshold
-            'hot': [],         # configured range
-            'warm': [],        # configured range
-            'moderate': [],    # configured range
-            'cool': [],        # configured range
-            'cold': []         # < configured threshold
+        # Each range includes its upper threshold, so a city exactly on a
+        # threshold falls in the lower range (e.g. 30°C is 'warm', not 'hot')
+        thresholds = [
+            TEMP_RANGES['cool'],
+            TEMP_RANGES['moderate'],
+            TEMP_RANGES['warm'],
+            TEMP_RANGES['hot'],
+            TEMP_RANGES['very_hot']
+        ]
+        labels = ['cold', 'cool', 'moderate', 'warm', 'hot', 'very_hot']
+        
+        temperatures = self._columns['temperature']
+        codes = np.searchsorted(thresholds, temperatures, side='left')
+        # Missing readings would otherwise sort past every threshold
+        codes[np.isnan(temperatures)] = -1
+        
+        # Hottest range first, with empty lists for ranges that have no cities
+        return {
+            label: self._cities[codes == code].tolist()
+            for code, label in reversed(list(enumerate(labels)))
         }
-
-        for _, row in self.data.iterrows():
-            temp = row['temperature']
-            city = row['city']
-
-            if temp > TEMP_RANGES['very_hot']:
-                temp_ranges['very_hot'].append(city)
-            elif temp > TEMP_RANGES['hot']:
-                temp_ranges['hot'].append(city)
-            elif temp > TEMP_RANGES['warm']:
-                temp_ranges['warm'].append(city)
-            elif temp > TEMP_RANGES['moderate']:
-                temp_ranges['moderate'].append(city)
-            elif temp > TEMP_RANGES['cool']:
-                temp_ranges['cool'].append(city)
-            else:
-                temp_ranges['cold'].append(city)
-        
-        return temp_ranges
     
+    @_memoized
     def get_comprehensive_analysis(self) -> Dict:
         """
         Get comprehensive analysis of all weather data.
         
+        The result is cached, so repeated calls are cheap. The nested values
+        are shared between calls and should not be modified.
+        
         Returns:
             Dict: Complete analysis results
         """
+        if self.data.empty:
+            return {'total_cities': 0}
+        
         return {
             'temperature_stats': self.get_temperature_stats(),
             'humidity_stats': self.get_humidity_stats(),
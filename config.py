@@ -20,9 +20,14 @@ DEFAULT_REPORT_FILE = 'weather_report.txt'
 API_TIMEOUT = 10  # seconds
 API_UNITS = 'metric'  # for Celsius temperature
 API_RATE_LIMIT_DELAY = 0.1  # seconds between API calls
+API_MAX_CONCURRENT_REQUESTS = 20  # in-flight requests when aiohttp is installed
+API_CACHE_TTL = 600  # seconds to reuse a city's response (0 disables caching)
+API_CACHE_FILE = os.path.join(os.path.expanduser('~'), '.cache', 'weather-cli', 'api_cache')
 
 # Application settings
 MAX_RETRIES = 3
+RETRY_BACKOFF = 0.2  # seconds, doubled after each retry
+RETRY_STATUS_CODES = (429, 500, 502, 503, 504)  # rate limited or server errors
 VERBOSE_OUTPUT = True
 
 # Temperature ranges for categorization (in Celsius)
@@ -4,7 +4,7 @@ Data handling module for saving and loading weather data.
 import pandas as pd
 import json
 import os
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Union
 from config import DEFAULT_DATA_FILE
 
 
@@ -14,23 +14,23 @@ class DataHandler:
     def __init__(self, data_file: str = DEFAULT_DATA_FILE):
         self.data_file = data_file
     
-    def save_to_csv(self, weather_data: List[Dict]) -> bool:
+    def save_to_csv(self, weather_data: Union[List[Dict], pd.DataFrame]) -> bool:
         """
         Save weather data to CSV file.
         
         Args:
-            weather_data (List[Dict]): List of weather data dictionaries
+            weather_data (Union[List[Dict], pd.DataFrame]): Weather data records or DataFrame
             
         Returns:
             bool: True if successful, False otherwise
         """
         try:
-            if not weather_data:
+            if weather_data is None or len(weather_data) == 0:
                 print("No data to save.")
                 return False
             
-            df = pd.DataFrame(weather_data)
-            df.to_csv(self.data_file, index=False)
+            df = weather_data if isinstance(weather_data, pd.DataFrame) else pd.DataFrame(weather_data)
+            df.to_csv(self.data_file, index=False, lineterminator='\n')
             print(f"Data saved to {self.data_file}")
             return True
             
@@ -38,26 +38,29 @@ class DataHandler:
             print(f"Error saving data to CSV: {e}")
             return False
     
-    def save_to_json(self, weather_data: List[Dict], filename: str = None) -> bool:
+    def save_to_json(self, weather_data: Union[List[Dict], pd.DataFrame], filename: str = None) -> bool:
         """
         Save weather data to JSON file.
         
         Args:
-            weather_data (List[Dict]): List of weather data dictionaries
+            weather_data (Union[List[Dict], pd.DataFrame]): Weather data records or DataFrame
             filename (str): Optional custom filename
             
         Returns:
             bool: True if successful, False otherwise
         """
         try:
-            if not weather_data:
+            if weather_data is None or len(weather_data) == 0:
                 print("No data to save.")
                 return False
             
             json_file = filename or self.data_file.replace('.csv', '.json')
             
-            with open(json_file, 'w', encoding='utf-8') as f:
-                json.dump(weather_data, f, indent=2, ensure_ascii=False)
+            if isinstance(weather_data, pd.DataFrame):
+                weather_data.to_json(json_file, orient='records', indent=2, force_ascii=False)
+            else:
+                with open(json_file, 'w', encoding='utf-8') as f:
+                    json.dump(weather_data, f, indent=2, ensure_ascii=False)
             
             print(f"Data saved to {json_file}")
             return True
@@ -78,7 +81,15 @@ class DataHandler:
                 print(f"Data file {self.data_file} not found.")
                 return None
             
-            df = pd.read_csv(self.data_file)
+            # Few distinct descriptions repeat across cities, so store them as
+            # categories; timestamps stay strings so both parsers agree
+            dtype = {'timestamp': str, 'description': 'category'}
+            try:
+                # The multithreaded pyarrow parser is used when pyarrow is installed,
+                # falling back to the more lenient C parser if it rejects the file
+                df = pd.read_csv(self.data_file, engine='pyarrow', dtype=dtype)
+            except (ImportError, ValueError):
+                df = pd.read_csv(self.data_file, dtype=dtype)
             print(f"Data loaded from {self.data_file}")
             return df
             
@@ -115,7 +126,7 @@ class DataHandler:
     
     def read_cities_file(self, cities_file: str) -> List[str]:
         """
-        Read city names from text file.
+        Read city names from text file, skipping blank lines and duplicates.
         
         Args:
             cities_file (str): Path to cities file
@@ -129,7 +140,11 @@ class DataHandler:
                 return []
             
             with open(cities_file, 'r', encoding='utf-8') as f:
-                cities = [line.strip() for line in f if line.strip()]
+                lines = f.read().splitlines()
+            
+            cities = [city for city in (line.strip() for line in lines) if city]
+            # Drop repeated cities so each one is only fetched once
+            cities = list(dict.fromkeys(cities))
             
             print(f"Loaded {len(cities)} cities from {cities_file}")
             return cities
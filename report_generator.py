@@ -1,10 +1,11 @@
 """
 Report generation module for creating formatted weather reports.
 """
+import io
 import os
 from datetime import datetime
-from typing import Dict, List
-from tabulate import tabulate
+from typing import Dict, List, Optional
+import pandas as pd
 from config import DEFAULT_REPORT_FILE
 
 
@@ -14,70 +15,67 @@ class ReportGenerator:
     def __init__(self, report_file: str = DEFAULT_REPORT_FILE):
         self.report_file = report_file
     
-    def generate_report(self, analysis: Dict, raw_data: List[Dict] = None) -> str:
+    def generate_report(self, analysis: Dict, raw_df: Optional[pd.DataFrame] = None) -> str:
         """
         Generate a comprehensive weather report.
         
         Args:
             analysis (Dict): Analysis results from WeatherAnalyzer
-            raw_data (List[Dict]): Raw weather data (optional)
+            raw_df (pd.DataFrame): Raw weather data (optional)
             
         Returns:
             str: Formatted report content
         """
-        report_lines = []
+        buffer = io.StringIO()
         
         # Header
-        report_lines.append("=" * 60)
-        report_lines.append("WEATHER ANALYSIS REPORT")
-        report_lines.append("=" * 60)
-        report_lines.append(f"Generated on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-        report_lines.append(f"Total cities analyzed: {analysis.get('total_cities', 0)}")
-        report_lines.append("")
+        buffer.write("=" * 60 + "\n")
+        buffer.write("WEATHER ANALYSIS REPORT\n")
+        buffer.write("=" * 60 + "\n")
+        buffer.write(f"Generated on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
+        buffer.write(f"Total cities analyzed: {analysis.get('total_cities', 0)}\n")
+        buffer.write("\n")
         
         # Temperature Analysis
         temp_stats = analysis.get('temperature_stats', {})
         if temp_stats:
-            report_lines.append("TEMPERATURE ANALYSIS")
-            report_lines.append("-" * 30)
-            report_lines.append(f"Highest Temperature: {temp_stats.get('highest_temp', 'N/A')}°C - {temp_stats.get('highest_temp_city', 'N/A')}")
-            report_lines.append(f"Lowest Temperature: {temp_stats.get('lowest_temp', 'N/A')}°C - {temp_stats.get('lowest_temp_city', 'N/A')}")
-            report_lines.append(f"Average Temperature: {temp_stats.get('average_temp', 'N/A')}°C")
-            report_lines.append(f"Median Temperature: {temp_stats.get('median_temp', 'N/A')}°C")
-            report_lines.append("")
+            buffer.write("TEMPERATURE ANALYSIS\n")
+            buffer.write("-" * 30 + "\n")
+            buffer.write(f"Highest Temperature: {temp_stats.get('highest_temp', 'N/A')}°C - {temp_stats.get('highest_temp_city', 'N/A')}\n")
+            buffer.write(f"Lowest Temperature: {temp_stats.get('lowest_temp', 'N/A')}°C - {temp_stats.get('lowest_temp_city', 'N/A')}\n")
+            buffer.write(f"Average Temperature: {temp_stats.get('average_temp', 'N/A')}°C\n")
+            buffer.write(f"Median Temperature: {temp_stats.get('median_temp', 'N/A')}°C\n")
+            buffer.write("\n")
         
         # Weather Categories
         weather_cats = analysis.get('weather_categories', {})
         if weather_cats:
-            report_lines.append("WEATHER CONDITIONS")
-            report_lines.append("-" * 30)
+            buffer.write("WEATHER CONDITIONS\n")
+            buffer.write("-" * 30 + "\n")
             
             clear_cities = weather_cats.get('clear', [])
             if clear_cities:
-                report_lines.append(f"Clear Weather Cities: {len(clear_cities)}")
-                for city in clear_cities:
-                    report_lines.append(f"  • {city}")
-                report_lines.append("")
+                buffer.write(f"Clear Weather Cities: {len(clear_cities)}\n")
+                buffer.writelines(f"  • {city}\n" for city in clear_cities)
+                buffer.write("\n")
             
             rain_cities = weather_cats.get('rain', [])
             if rain_cities:
-                report_lines.append(f"Rain in Cities: {len(rain_cities)}")
-                for city in rain_cities:
-                    report_lines.append(f"  • {city}")
-                report_lines.append("")
+                buffer.write(f"Rain in Cities: {len(rain_cities)}\n")
+                buffer.writelines(f"  • {city}\n" for city in rain_cities)
+                buffer.write("\n")
             
             cloud_cities = weather_cats.get('clouds', [])
             if cloud_cities:
-                report_lines.append(f"Cloudy Cities: {len(cloud_cities)}")
-                for city in cloud_cities:
-                    report_lines.append(f"  • {city}")
-                report_lines.append("")
+                buffer.write(f"Cloudy Cities: {len(cloud_cities)}\n")
+                buffer.writelines(f"  • {city}\n" for city in cloud_cities)
+                buffer.write("\n")
         
         # Temperature Ranges
         temp_ranges = analysis.get('temperature_ranges', {})
         if temp_ranges:
-            report_lines.append("TEMPERATURE RANGES")
-            report_lines.append("-" * 30)
+            buffer.write("TEMPERATURE RANGES\n")
+            buffer.write("-" * 30 + "\n")
             
             range_labels = {
                 'very_hot': 'Very Hot (>35°C)',
@@ -91,58 +89,82 @@ class ReportGenerator:
             for range_key, cities in temp_ranges.items():
                 if cities:
                     label = range_labels.get(range_key, range_key.title())
-                    report_lines.append(f"{label}: {len(cities)} cities")
-                    for city in cities:
-                        report_lines.append(f"  • {city}")
-                    report_lines.append("")
+                    buffer.write(f"{label}: {len(cities)} cities\n")
+                    buffer.writelines(f"  • {city}\n" for city in cities)
+                    buffer.write("\n")
         
         # Humidity and Wind Analysis
         humidity_stats = analysis.get('humidity_stats', {})
         wind_stats = analysis.get('wind_stats', {})
         
         if humidity_stats or wind_stats:
-            report_lines.append("ADDITIONAL METRICS")
-            report_lines.append("-" * 30)
+            buffer.write("ADDITIONAL METRICS\n")
+            buffer.write("-" * 30 + "\n")
             
             if humidity_stats:
-                report_lines.append("Humidity:")
-                report_lines.append(f"  Highest: {humidity_stats.get('highest_humidity', 'N/A')}% - {humidity_stats.get('highest_humidity_city', 'N/A')}")
-                report_lines.append(f"  Lowest: {humidity_stats.get('lowest_humidity', 'N/A')}% - {humidity_stats.get('lowest_humidity_city', 'N/A')}")
-                report_lines.append(f"  Average: {humidity_stats.get('average_humidity', 'N/A')}%")
-                report_lines.append("")
+                buffer.write("Humidity:\n")
+                buffer.write(f"  Highest: {humidity_stats.get('highest_humidity', 'N/A')}% - {humidity_stats.get('highest_humidity_city', 'N/A')}\n")
+                buffer.write(f"  Lowest: {humidity_stats.get('lowest_humidity', 'N/A')}% - {humidity_stats.get('lowest_humidity_city', 'N/A')}\n")
+                buffer.write(f"  Average: {humidity_stats.get('average_humidity', 'N/A')}%\n")
+                buffer.write("\n")
             
             if wind_stats:
-                report_lines.append("Wind Speed:")
-                report_lines.append(f"  Highest: {wind_stats.get('highest_wind', 'N/A')} m/s - {wind_stats.get('highest_wind_city', 'N/A')}")
-                report_lines.append(f"  Lowest: {wind_stats.get('lowest_wind', 'N/A')} m/s - {wind_stats.get('lowest_wind_city', 'N/A')}")
-                report_lines.append(f"  Average: {wind_stats.get('average_wind', 'N/A')} m/s")
-                report_lines.append("")
+                buffer.write("Wind Speed:\n")
+                buffer.write(f"  Highest: {wind_stats.get('highest_wind', 'N/A')} m/s - {wind_stats.get('highest_wind_city', 'N/A')}\n")
+                buffer.write(f"  Lowest: {wind_stats.get('lowest_wind', 'N/A')} m/s - {wind_stats.get('lowest_wind_city', 'N/A')}\n")
+                buffer.write(f"  Average: {wind_stats.get('average_wind', 'N/A')} m/s\n")
+                buffer.write("\n")
         
         # Raw data table (if provided)
-        if raw_data:
-            report_lines.append("DETAILED WEATHER DATA")
-            report_lines.append("-" * 30)
+        if raw_df is not None and not raw_df.empty:
+            buffer.write("DETAILED WEATHER DATA\n")
+            buffer.write("-" * 30 + "\n")
             
-            table_data = []
-            for item in raw_data:
-                table_data.append([
-                    item.get('city', 'N/A'),
-                    f"{item.get('temperature', 'N/A')}°C",
-                    f"{item.get('humidity', 'N/A')}%",
-                    item.get('description', 'N/A'),
-                    f"{item.get('wind_speed', 'N/A')} m/s"
-                ])
+            # Read each column once as an array rather than building a dict per row
+            cities = raw_df['city'].to_numpy()
+            temperatures = raw_df['temperature'].to_numpy()
+            humidities = raw_df['humidity'].to_numpy()
+            descriptions = raw_df['description'].to_numpy()
+            wind_speeds = raw_df['wind_speed'].to_numpy()
+            
+            table_data = [
+                [city, f"{temperature}°C", f"{humidity}%", description, f"{wind_speed} m/s"]
+                for city, temperature, humidity, description, wind_speed
+                in zip(cities, temperatures, humidities, descriptions, wind_speeds)
+            ]
             
             headers = ['City', 'Temperature', 'Humidity', 'Description', 'Wind Speed']
-            table = tabulate(table_data, headers=headers, tablefmt='grid')
-            report_lines.append(table)
-            report_lines.append("")
+            buffer.writelines(self._format_table(headers, table_data))
+            buffer.write("\n")
+        
+        buffer.write("=" * 60 + "\n")
+        buffer.write("End of Report\n")
+        buffer.write("=" * 60)
+        
+        return buffer.getvalue()
+    
+    def _format_table(self, headers: List[str], rows: List[List]) -> List[str]:
+        """
+        Format rows as a left-aligned plain-text table.
         
-        report_lines.append("=" * 60)
-        report_lines.append("End of Report")
-        report_lines.append("=" * 60)
+        Args:
+            headers (List[str]): Column headers
+            rows (List[List]): Table rows
+            
+        Returns:
+            List[str]: Table lines, each ending with a newline
+        """
+        rows = [[str(cell) for cell in row] for row in rows]
+        widths = [
+            max([len(header)] + [len(row[i]) for row in rows])
+            for i, header in enumerate(headers)
+        ]
+        line_format = "  ".join(f"{{:<{width}}}" for width in widths)
         
-        return "\n".join(report_lines)
+        lines = [line_format.format(*headers).rstrip() + "\n"]
+        lines.append("-" * (sum(widths) + 2 * (len(widths) - 1)) + "\n")
+        lines.extend(line_format.format(*row).rstrip() + "\n" for row in rows)
+        return lines
     
     def save_report(self, report_content: str) -> bool:
         """
@@ -1,10 +1,48 @@
 """
 Weather API integration module for fetching weather data from OpenWeatherMap.
 """
+import asyncio
+import dbm
+import os
+import pandas as pd
 import requests
+import shelve
 import time
-from typing import Dict, Optional, List
-from config import API_KEY, BASE_URL, API_TIMEOUT, API_UNITS, API_RATE_LIMIT_DELAY, MAX_RETRIES
+from email.utils import parsedate_to_datetime
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from typing import Dict, Optional, List, Tuple
+from config import (
+    API_KEY, BASE_URL, API_TIMEOUT, API_UNITS, API_RATE_LIMIT_DELAY,
+    API_MAX_CONCURRENT_REQUESTS, API_CACHE_TTL, API_CACHE_FILE, MAX_RETRIES,
+    RETRY_BACKOFF, RETRY_STATUS_CODES
+)
+
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+
+def _round_reading(value: float) -> float:
+    """Round a reading to one decimal place, as reported in the saved data."""
+    # The builtin round keeps single and batch parsing in agreement; pandas'
+    # Series.round rounds half to even on the scaled value (1.05 -> 1.0)
+    return round(value, 1)
+
+
+def _retry_after_seconds(value: Optional[str]) -> float:
+    """Convert a Retry-After header (seconds or HTTP date) into a delay in seconds."""
+    if not value:
+        return 0.0
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        return max(parsedate_to_datetime(value).timestamp() - time.time(), 0.0)
+    except (TypeError, ValueError):
+        return 0.0
 
 
 class WeatherAPI:
@@ -15,6 +53,114 @@ class WeatherAPI:
         self.base_url = BASE_URL
         self.timeout = API_TIMEOUT
         self.units = API_UNITS
+        
+        # Reuse one pooled session so repeated requests share keep-alive connections.
+        # The concurrent aiohttp path opens its own session and applies the same
+        # retry policy in _fetch_raw_data_async.
+        retry = Retry(
+            total=MAX_RETRIES,
+            backoff_factor=RETRY_BACKOFF,
+            status_forcelist=RETRY_STATUS_CODES,
+            raise_on_status=False
+        )
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=32, max_retries=retry)
+        self.session = requests.Session()
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        
+        # Responses are cached per city on disk so repeated runs within the
+        # TTL skip the API; fall back to an in-memory cache if that fails
+        self.cache_ttl = API_CACHE_TTL
+        self._cache = {}
+        if self.cache_ttl > 0:
+            try:
+                os.makedirs(os.path.dirname(API_CACHE_FILE), exist_ok=True)
+                self._cache = shelve.open(API_CACHE_FILE)
+            except (OSError, dbm.error) as e:
+                print(f"Could not open API cache {API_CACHE_FILE}: {e}")
+            self._evict_expired()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+    
+    def close(self):
+        """Close the underlying HTTP session and response cache."""
+        self.session.close()
+        if isinstance(self._cache, shelve.Shelf):
+            self._cache.close()
+    
+    def _cache_key(self, city: str) -> str:
+        """
+        Build the cache key for a city, including the units requested.
+        
+        Args:
+            city (str): Name of the city
+            
+        Returns:
+            str: Cache key
+        """
+        return f"{self.units}:{city.strip().lower()}"
+    
+    def _evict_expired(self):
+        """Drop every expired entry so the cache file doesn't grow without bound."""
+        now = time.time()
+        expired = [
+            key for key, (fetched_at, _) in self._cache.items()
+            if now - fetched_at >= self.cache_ttl
+        ]
+        for key in expired:
+            del self._cache[key]
+    
+    def _get_cached(self, city: str) -> Optional[Tuple[float, Dict]]:
+        """
+        Look up a cached response for a city, evicting it if expired.
+        
+        Args:
+            city (str): Name of the city
+            
+        Returns:
+            Tuple[float, Dict]: Fetch time and raw API response, or None if missing or expired
+        """
+        key = self._cache_key(city)
+        entry = self._cache.get(key)
+        if entry is None:
+            return None
+        
+        fetched_at, _ = entry
+        if time.time() - fetched_at >= self.cache_ttl:
+            del self._cache[key]
+            return None
+        return entry
+    
+    def _store_cached(self, city: str, entry: Tuple[float, Dict]):
+        """
+        Cache a raw API response that parsed successfully, if caching is enabled.
+        
+        Args:
+            city (str): Name of the city
+            entry (Tuple[float, Dict]): Fetch time and raw API response
+        """
+        if self.cache_ttl > 0:
+            self._cache[self._cache_key(city)] = entry
+    
+    def _build_params(self, city: str) -> Dict:
+        """
+        Build query parameters for a city weather request.
+        
+        Args:
+            city (str): Name of the city
+            
+        Returns:
+            Dict: Query parameters
+        """
+        return {
+            'q': city,
+            'appid': self.api_key,
+            'units': self.units
+        }
     
     def fetch_weather_data(self, city: str) -> Optional[Dict]:
         """
@@ -26,22 +172,43 @@ class WeatherAPI:
         Returns:
             Dict: Weather data or None if failed
         """
+        entry = self._fetch_raw_data(city)
+        if entry is None:
+            return None
+        
+        fetched_at, data = entry
         try:
-            params = {
-                'q': city,
-                'appid': self.api_key,
-                'units': self.units
-            }
+            weather = self._parse_weather_data(data, city, fetched_at)
+        except (KeyError, IndexError, TypeError, AttributeError) as e:
+            print(f"Unexpected response for {city}: {e}")
+            return None
+        
+        self._store_cached(city, entry)
+        return weather
+    
+    def _fetch_raw_data(self, city: str) -> Optional[Tuple[float, Dict]]:
+        """
+        Fetch the raw API response for a specific city.
+        
+        Args:
+            city (str): Name of the city
             
-            response = requests.get(
+        Returns:
+            Tuple[float, Dict]: Fetch time and raw API response, or None if failed
+        """
+        cached = self._get_cached(city)
+        if cached:
+            return cached
+        
+        try:
+            response = self.session.get(
                 self.base_url,
-                params=params,
+                params=self._build_params(city),
                 timeout=self.timeout
             )
             
             if response.status_code == 200:
-                data = response.json()
-                return self._parse_weather_data(data, city)
+                return time.time(), response.json()
             elif response.status_code == 404:
                 print(f"City '{city}' not found.")
                 return None
@@ -56,52 +223,196 @@ class WeatherAPI:
             print(f"Unexpected error for {city}: {e}")
             return None
     
-    def _parse_weather_data(self, data: Dict, city: str) -> Dict:
+    async def _fetch_raw_data_async(self, session: 'aiohttp.ClientSession',
+                                    city: str) -> Optional[Tuple[float, Dict]]:
+        """
+        Fetch the raw API response for a specific city using an aiohttp session.
+        
+        Args:
+            session (aiohttp.ClientSession): Shared HTTP session
+            city (str): Name of the city
+            
+        Returns:
+            Tuple[float, Dict]: Fetch time and raw API response, or None if failed
+        """
+        cached = self._get_cached(city)
+        if cached:
+            return cached
+        
+        for attempt in range(MAX_RETRIES + 1):
+            retry_after = 0.0
+            try:
+                async with session.get(self.base_url, params=self._build_params(city)) as response:
+                    if response.status == 200:
+                        return time.time(), await response.json()
+                    elif response.status == 404:
+                        print(f"City '{city}' not found.")
+                        return None
+                    elif response.status not in RETRY_STATUS_CODES or attempt == MAX_RETRIES:
+                        print(f"Error fetching data for {city}: {response.status}")
+                        return None
+                    # Honour the server's Retry-After, as urllib3's Retry does
+                    retry_after = _retry_after_seconds(response.headers.get('Retry-After'))
+                        
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                if attempt == MAX_RETRIES:
+                    print(f"Network error for {city}: {e!r}")
+                    return None
+            except Exception as e:
+                print(f"Unexpected error for {city}: {e}")
+                return None
+            
+            # Back off before retrying rate-limited, failed or timed out requests
+            await asyncio.sleep(max(RETRY_BACKOFF * 2 ** attempt, retry_after))
+    
+    async def _fetch_multiple_cities_async(self, cities: List[str]) -> List[Optional[Tuple[float, Dict]]]:
+        """
+        Fetch raw API responses for multiple cities concurrently.
+        
+        Args:
+            cities (List[str]): List of city names
+            
+        Returns:
+            List[Optional[Tuple[float, Dict]]]: Fetch time and raw response (or None)
+                for each city, in input order
+        """
+        total_cities = len(cities)
+        # The semaphore caps in-flight requests to stay within API rate limits
+        semaphore = asyncio.Semaphore(API_MAX_CONCURRENT_REQUESTS)
+        timeout = aiohttp.ClientTimeout(total=self.timeout)
+        
+        async with aiohttp.ClientSession(timeout=timeout) as session:
+            async def bounded_fetch(i: int, city: str) -> Optional[Tuple[float, Dict]]:
+                async with semaphore:
+                    print(f"Processing {i}/{total_cities}: {city}")
+                    return await self._fetch_raw_data_async(session, city.strip())
+            
+            return await asyncio.gather(
+                *(bounded_fetch(i, city) for i, city in enumerate(cities, 1))
+            )
+    
+    def _parse_weather_data(self, data: Dict, city: str, fetched_at: float = None) -> Dict:
         """
         Parse raw API response into structured weather data.
         
         Args:
             data (Dict): Raw API response
             city (str): City name
+            fetched_at (float): Epoch time the response was fetched (defaults to now)
             
         Returns:
             Dict: Parsed weather data
         """
         return {
             'city': city,
-            'temperature': round(data['main']['temp'], 1),
+            'temperature': _round_reading(data['main']['temp']),
             'humidity': data['main']['humidity'],
             'description': data['weather'][0]['description'].title(),
-            'wind_speed': round(data['wind']['speed'], 1),
+            'wind_speed': _round_reading(data['wind']['speed']),
             'country': data['sys']['country'],
-            'timestamp': time.strftime('%Y-%m-%d %H:%M:%S')
+            'timestamp': time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(fetched_at))
         }
     
-    def fetch_multiple_cities(self, cities: List[str]) -> List[Dict]:
+    def parse_batch(self, raw_responses: List[Dict], cities: List[str],
+                    fetched_at: List[float] = None) -> pd.DataFrame:
+        """
+        Parse a batch of raw API responses into a DataFrame in one pass.
+        
+        Malformed responses are reported and dropped. The result keeps the
+        position of each response in raw_responses as its index.
+        
+        Args:
+            raw_responses (List[Dict]): Raw API responses
+            cities (List[str]): City name for each response
+            fetched_at (List[float]): Epoch fetch time for each response (defaults to now)
+            
+        Returns:
+            pd.DataFrame: Parsed weather data, one row per valid response
+        """
+        columns = ['city', 'temperature', 'humidity', 'description', 'wind_speed', 'country', 'timestamp']
+        if not raw_responses:
+            return pd.DataFrame(columns=columns)
+        if fetched_at is None:
+            fetched_at = [time.time()] * len(raw_responses)
+        
+        # Only the top level goes through the DataFrame constructor; nested
+        # fields are pulled out per column, which is much cheaper than
+        # flattening every key of every response with json_normalize
+        top = pd.DataFrame.from_records(raw_responses, columns=['main', 'weather', 'wind', 'sys'])
+        # .str methods yield NaN for anything of the wrong type, so missing
+        # sections, empty weather lists and non-string descriptions are all
+        # dropped below (astype(object) keeps .str usable on all-NaN steps)
+        main = top['main'].astype(object)
+        description = top['weather'].astype(object).str[0].astype(object).str.get('description')
+        df = pd.DataFrame({
+            'city': cities,
+            'temperature': pd.to_numeric(main.str.get('temp'), errors='coerce'),
+            'humidity': pd.to_numeric(main.str.get('humidity'), errors='coerce'),
+            'description': description.astype(object).str.title(),
+            'wind_speed': pd.to_numeric(top['wind'].astype(object).str.get('speed'), errors='coerce'),
+            'country': top['sys'].astype(object).str.get('country')
+        })
+        
+        valid = df.dropna()
+        for position in df.index.difference(valid.index):
+            print(f"Unexpected response for {cities[position]}: missing or invalid fields")
+        df = valid.copy()
+        
+        # Humidity turns float if a dropped row lacked it; restore whole percentages
+        if (df['humidity'] % 1 == 0).all():
+            df['humidity'] = df['humidity'].astype('int64')
+        df['temperature'] = df['temperature'].map(_round_reading)
+        df['wind_speed'] = df['wind_speed'].map(_round_reading)
+        
+        # A batch is fetched within a few seconds, so format each distinct
+        # second once in local time instead of converting every row
+        seconds = pd.Series(fetched_at).iloc[df.index].astype('int64')
+        df['timestamp'] = seconds.map({
+            second: time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(second))
+            for second in seconds.unique()
+        }).to_numpy()
+        
+        return df[columns]
+    
+    def fetch_multiple_cities(self, cities: List[str]) -> pd.DataFrame:
         """
         Fetch weather data for multiple cities.
         
+        Requests run concurrently when aiohttp is installed, otherwise
+        sequentially with a small delay between calls.
+        
         Args:
             cities (List[str]): List of city names
             
         Returns:
-            List[Dict]: List of weather data dictionaries
+            pd.DataFrame: Weather data for the cities that were fetched
         """
-        weather_data = []
         total_cities = len(cities)
         
         print(f"Fetching weather data for {total_cities} cities...")
         
-        for i, city in enumerate(cities, 1):
-            print(f"Processing {i}/{total_cities}: {city}")
-            
-            data = self.fetch_weather_data(city.strip())
-            if data:
-                weather_data.append(data)
-            
-            # Add small delay to avoid hitting API rate limits
-            if i < total_cities:
-                time.sleep(API_RATE_LIMIT_DELAY)
+        if aiohttp is not None:
+            results = asyncio.run(self._fetch_multiple_cities_async(cities))
+        else:
+            results = []
+            for i, city in enumerate(cities, 1):
+                print(f"Processing {i}/{total_cities}: {city}")
+                results.append(self._fetch_raw_data(city.strip()))
+                
+                # Add small delay to avoid hitting API rate limits
+                if i < total_cities:
+                    time.sleep(API_RATE_LIMIT_DELAY)
+        
+        fetched = [(city.strip(), entry) for city, entry in zip(cities, results) if entry]
+        weather_data = self.parse_batch(
+            [data for _, (_, data) in fetched],
+            [city for city, _ in fetched],
+            [fetched_at for _, (fetched_at, _) in fetched]
+        )
+        # Only responses that survived parsing are cached
+        for position in weather_data.index:
+            self._store_cached(*fetched[position])
+        weather_data = weather_data.reset_index(drop=True)
         
         print(f"Successfully fetched data for {len(weather_data)} cities.")
         return weather_data
@@ -42,7 +42,6 @@ def fetch(cities_file: str, output: str, format: str):
     
     # Initialize components
     data_handler = DataHandler(output)
-    weather_api = WeatherAPI()
     
     # Read cities
     cities = data_handler.read_cities_file(cities_file)
@@ -53,9 +52,10 @@ def fetch(cities_file: str, output: str, format: str):
     click.echo(f"🌤️  Starting weather data collection for {len(cities)} cities...")
     
     # Fetch weather data
-    weather_data = weather_api.fetch_multiple_cities(cities)
+    with WeatherAPI() as weather_api:
+        weather_data = weather_api.fetch_multiple_cities(cities)
     
-    if not weather_data:
+    if weather_data.empty:
         click.echo("❌ No weather data collected. Please check your API key and internet connection.")
         sys.exit(1)
     
@@ -99,8 +99,8 @@ def analyze(data_file: str, report_file: str, show_table: bool):
     analysis = analyzer.get_comprehensive_analysis()
     
     # Generate report
-    raw_data = df.to_dict('records') if show_table else None
-    report_content = report_generator.generate_report(analysis, raw_data)
+    raw_df = df if show_table else None
+    report_content = report_generator.generate_report(analysis, raw_df)
     
     # Save and display report
     report_generator.save_report(report_content)